@@ -11,22 +11,15 @@ import typing as typ
 
 
 class _RequestLike(typ.Protocol):
-    """Small request surface shared by Falcon WSGI and ASGI."""
+    """Small request surface shared by Falcon WSGI and ASGI.
 
-    context: typ.Any
-
-    @property
-    def remote_addr(self) -> str:
-        """IP address of the request source.
+    The shared lifecycle only touches ``context``. The framework-specific
+    ``process_request`` hooks read the correlation header and peer address
+    themselves and pass them in: the WSGI hook reads ``req.env`` directly,
+    while the ASGI hook calls ``get_header`` and ``remote_addr``.
+    """
 
-        Declared as a read-only property: the middleware only reads
-        this attribute, and Falcon's ``Request.remote_addr`` is itself
-        a read-only property, so a mutable protocol member would
-        (correctly) fail to match it under ty >= 0.0.57.
-        """
-
-    def get_header(self, name: str) -> str | None:
-        """Return a request header by name."""
+    context: typ.Any
 
 
 class _ResponseLike(typ.Protocol):
@@ -99,7 +99,12 @@ class CorrelationIDMiddlewareASGI(_CorrelationIDMiddlewareBase):
         resp: falcon.asgi.Response,
     ) -> None:
         """Process an incoming ASGI request to establish correlation ID context."""
-        self._process_request(req)
+        # Without trusted sources no incoming ID can be accepted, so the
+        # header is not read at all. Falcon resolves the ASGI peer from the
+        # connection scope, so ``remote_addr`` cannot be forged by headers.
+        incoming = req.get_header(self._header_name) if self._network_masks else None
+        remote_addr = req.remote_addr if incoming else None
+        self._process_request(req, incoming, remote_addr)
 
     # Falcon ASGI middleware hook requires this exact signature.
     # See https://github.com/leynos/falcon-correlate/issues/38
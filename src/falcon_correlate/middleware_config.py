@@ -13,6 +13,7 @@ settings, while this module depends on ``middleware_utils.py`` for
 from __future__ import annotations
 
 import dataclasses
+import functools
 import ipaddress
 import typing as typ
 
@@ -37,7 +38,7 @@ DEFAULT_HEADER_NAME = "X-Correlation-ID"
 _NetworkType = ipaddress.IPv4Network | ipaddress.IPv6Network
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True, weakref_slot=True)
 class CorrelationIDConfig:
     """Configuration for CorrelationIDMiddleware.
 
@@ -95,9 +96,12 @@ class CorrelationIDConfig:
         if isinstance(self.trusted_sources, str):
             msg = "trusted_sources must be an iterable of strings, not a string"
             raise TypeError(msg)
-        object.__setattr__(self, "trusted_sources", frozenset(self.trusted_sources))
+        trusted_sources = frozenset(self.trusted_sources)
+        object.__setattr__(self, "trusted_sources", trusted_sources)
         self._validate_header_name()
-        self._validate_trusted_sources()
+        if trusted_sources:
+            # With none configured, ``_parsed_networks`` keeps its ``()`` default
+            self._validate_trusted_sources()
         self._validate_generator()
         self._validate_validator()
 
@@ -139,7 +143,11 @@ class CorrelationIDConfig:
             msg = "trusted_sources must not contain empty strings"
             raise ValueError(msg)
 
+    # Apps rebuilt per test or per cold start pass the same sources again, so
+    # memoise the parse; network objects are immutable and failures raise
+    # rather than being cached.
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def _parse_network(source: str) -> _NetworkType:
         """Parse an IP address or CIDR notation into a network object.
 
@@ -160,10 +168,15 @@ class CorrelationIDConfig:
             CIDR notation.
 
         """
+        # ``strict=True`` rejects host bits with an integer mask check inside
+        # the single parse, so valid entries are never re-parsed; the error
+        # message is only inspected on the failure path. Other parse errors
+        # echo the input and end with their own text, so matching the suffix
+        # cannot be fooled by a source that merely contains the phrase.
         try:
             return ipaddress.ip_network(source, strict=True)
         except ValueError as err:
-            if "/" in source and "has host bits set" in str(err):
+            if str(err).endswith(" has host bits set"):
                 msg = f"Invalid CIDR notation '{source}': has host bits set"
             else:
                 msg = f"Invalid IP address or CIDR notation: '{source}'"
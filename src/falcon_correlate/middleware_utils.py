@@ -16,8 +16,21 @@ from __future__ import annotations
 import contextvars
 import importlib
 import logging
+import string
+import typing as typ
 import uuid
 
+if typ.TYPE_CHECKING:
+    import collections.abc as cabc
+
+    class _UUIDLike(typ.Protocol):
+        """UUID object from either ``uuid`` or ``uuid_utils``."""
+
+        @property
+        def hex(self) -> str:
+            """The UUID as 32 lowercase hex digits."""
+
+
 correlation_id_var: contextvars.ContextVar[str | None] = contextvars.ContextVar(
     "correlation_id", default=None
 )
@@ -160,11 +173,33 @@ class ContextualLogFilter(logging.Filter):
         return True
 
 
+def _resolve_uuid7() -> cabc.Callable[[], _UUIDLike]:
+    """Return ``uuid.uuid7`` when available, else ``uuid_utils.uuid7``.
+
+    Returns
+    -------
+    cabc.Callable[[], _UUIDLike]
+        The UUIDv7 factory used by ``default_uuid7_generator``.
+
+    """
+    uuid7 = getattr(uuid, "uuid7", None)
+    if uuid7 is not None:
+        return uuid7
+
+    uuid_utils = importlib.import_module("uuid_utils")
+    return uuid_utils.uuid7
+
+
+# Resolved once at import so each generated ID skips the module lookup
+_uuid7 = _resolve_uuid7()
+
+
 def default_uuid7_generator() -> str:
     """Generate a UUIDv7 correlation ID.
 
     Uses the standard library ``uuid.uuid7()`` when available and falls back
-    to ``uuid_utils.uuid7()`` when the runtime lacks ``uuid.uuid7()``.
+    to ``uuid_utils.uuid7()`` when the runtime lacks ``uuid.uuid7()``. The
+    implementation is chosen once, when this module is imported.
 
     Returns
     -------
@@ -172,41 +207,53 @@ def default_uuid7_generator() -> str:
         A UUIDv7 hex string representation.
 
     """
-    uuid7 = getattr(uuid, "uuid7", None)
-    if uuid7 is not None:
-        return uuid7().hex
-
-    uuid_utils = importlib.import_module("uuid_utils")
-    return uuid_utils.uuid7().hex
-
-
-# Maximum length for a valid UUID string (hyphenated format: 8-4-4-4-12)
-_MAX_UUID_LENGTH = 36
-# Minimum length for a valid UUID string (hex-only format: 32 characters)
-_MIN_UUID_LENGTH = 32
-# Expected hyphen positions in 8-4-4-4-12 format (indices 8, 13, 18, 23)
-_HYPHEN_POSITIONS = frozenset({8, 13, 18, 23})
-# Valid UUID versions per RFC 4122 and RFC 9562
-_VALID_UUID_VERSIONS = frozenset({1, 2, 3, 4, 5, 6, 7, 8})
-
-
-def _has_valid_hyphen_placement(value: str) -> bool:
-    """Return whether hyphens appear at standard UUID separator positions."""
-    for i, char in enumerate(value):
-        if char == "-":
-            if i not in _HYPHEN_POSITIONS:
-                return False
-        elif i in _HYPHEN_POSITIONS:
-            # Expected a hyphen but found a different character
-            return False
-    return True
+    return _uuid7().hex
+
+
+# Length of a hyphenated UUID string (8-4-4-4-12 format)
+_HYPHENATED_UUID_LENGTH = 36
+# Length of a hex-only UUID string (32 characters)
+_HEX_UUID_LENGTH = 32
+# Expected hyphen positions in 8-4-4-4-12 format (indices 8, 13, 18, 23) are
+# evenly spaced, so a single extended slice selects all four separators
+_HYPHEN_SEPARATORS = slice(8, 24, 5)
+_EXPECTED_SEPARATORS = "----"
+# Valid UUID version nibbles (versions 1-8) per RFC 4122 and RFC 9562
+_VALID_UUID_VERSION_NIBBLES = "12345678"
+# Variant nibbles (binary ``10xx``) for RFC 4122/9562 UUIDs; ``uuid.UUID``
+# reports no version for other variants, so they are rejected as well
+_RFC_4122_VARIANT_NIBBLES = "89abAB"
+# ASCII hex digits to delete with ``bytes.translate``, which scans through a
+# 256-entry byte table in C; any residue marks a non-hex input. Encoding with
+# ``errors="replace"`` turns non-ASCII characters into ``?`` so they are
+# rejected too
+_HEX_DIGIT_BYTES = string.hexdigits.encode("ascii")
+_EXPECTED_SEPARATOR_BYTES = _EXPECTED_SEPARATORS.encode("ascii")
+# Offsets of the version and variant nibbles in the 32-character hex form and
+# in the hyphenated form, where two and three separators precede them
+_VERSION_NIBBLE_INDEX = 12
+_VARIANT_NIBBLE_INDEX = 16
+_HYPHENATED_VERSION_NIBBLE_INDEX = 14
+_HYPHENATED_VARIANT_NIBBLE_INDEX = 19
+
+
+def _is_hyphenated_hex(value: str) -> bool:
+    """Return whether a 36-character value is hex split as 8-4-4-4-12."""
+    # Deleting the hex digits must leave exactly the four separators, and the
+    # slice confirms they sit at the standard positions
+    return (
+        value[_HYPHEN_SEPARATORS] == _EXPECTED_SEPARATORS
+        and value.encode("ascii", "replace").translate(None, _HEX_DIGIT_BYTES)
+        == _EXPECTED_SEPARATOR_BYTES
+    )
 
 
 def default_uuid_validator(value: str) -> bool:
     """Validate that a string is a valid UUID (versions 1-8).
 
     Accepts both hyphenated (8-4-4-4-12) and hex-only (32-character) UUID
-    formats. Case-insensitive. Rejects UUIDs with non-standard version nibbles.
+    formats. Case-insensitive, but only ASCII hex digits are accepted. Rejects
+    UUIDs with non-standard version nibbles or a non-RFC 4122/9562 variant.
     Enforces strict hyphen placement at positions 8, 13, 18, and 23 for
     36-character inputs.
 
@@ -230,27 +277,27 @@ def default_uuid_validator(value: str) -> bool:
     False
 
     """
-    # Early exit for empty strings
-    if not value:
-        return False
-
-    # Early exit for out-of-range length strings
+    # Dispatch on the only two valid lengths; empty, gap-length (33-35), and
+    # out-of-range strings all fall through to the rejection branch. Reject
+    # any non-hex character in a single C-level pass; unlike ``uuid.UUID``
+    # this never allocates an exception on the reject path. For 36-character
+    # strings, also enforce strict 8-4-4-4-12 hyphen placement, then read the
+    # nibbles in place rather than stripping hyphens
     length = len(value)
-    if length > _MAX_UUID_LENGTH or length < _MIN_UUID_LENGTH:
-        return False
-
-    # Reject strings in the 33-35 character "gap" (neither hex-only nor valid
-    # hyphenated format)
-    if _MIN_UUID_LENGTH < length < _MAX_UUID_LENGTH:
-        return False
-
-    # For 36-character strings, enforce strict 8-4-4-4-12 hyphen placement
-    if length == _MAX_UUID_LENGTH and not _has_valid_hyphen_placement(value):
-        return False
-
-    try:
-        parsed = uuid.UUID(value)
-    except ValueError:
+    if length == _HYPHENATED_UUID_LENGTH:
+        if not _is_hyphenated_hex(value):
+            return False
+        version = value[_HYPHENATED_VERSION_NIBBLE_INDEX]
+        variant = value[_HYPHENATED_VARIANT_NIBBLE_INDEX]
+    elif length != _HEX_UUID_LENGTH or value.encode("ascii", "replace").translate(
+        None, _HEX_DIGIT_BYTES
+    ):
         return False
-    # Enforce valid UUID version (1-8)
-    return parsed.version in _VALID_UUID_VERSIONS
+    else:
+        version = value[_VERSION_NIBBLE_INDEX]
+        variant = value[_VARIANT_NIBBLE_INDEX]
+
+    # Enforce valid UUID version (1-8) and the RFC 4122/9562 variant
+    return (
+        version in _VALID_UUID_VERSION_NIBBLES and variant in _RFC_4122_VARIANT_NIBBLES
+    )
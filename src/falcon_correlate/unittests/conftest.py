@@ -12,11 +12,6 @@ request_response_factory
 isolated_context
     Runner callable that executes a zero-argument function inside a fresh
     ``contextvars.Context``, preventing cross-test leakage.
-logger_with_capture
-    Yields a factory callable that, when called with a logger name,
-    returns a ``(logging.Logger, io.StringIO)`` pair configured with a
-    ``ContextualLogFilter``-equipped ``StreamHandler``.  All handlers
-    created via the factory are cleaned up on fixture teardown.
 
 Usage
 -----
@@ -44,33 +39,22 @@ Run a callable in an isolated context to avoid contextvar bleed::
 
         isolated_context(_inner)
 
-Build a logger with contextual log capture::
-
-    def test_logger(logger_with_capture):
-        test_logger, stream = logger_with_capture("my_test_logger")
-        test_logger.info("hello")
-        assert "hello" in stream.getvalue()
-
 """
 
 from __future__ import annotations
 
 import contextvars
-import io
-import logging
 import typing as typ
 
 import falcon
 import falcon.testing
 import pytest
 
-from falcon_correlate import ContextualLogFilter
-
 if typ.TYPE_CHECKING:
     import collections.abc as cabc
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def request_response_factory() -> cabc.Callable[
     ..., tuple[falcon.Request, falcon.Response]
 ]:
@@ -90,6 +74,11 @@ def request_response_factory() -> cabc.Callable[
         The callable returns a ``(falcon.Request, falcon.Response)`` tuple
         constructed via ``falcon.testing.create_environ``.
 
+    Notes
+    -----
+    The factory holds no state between calls, so it is built once per
+    module.
+
     """
 
     def factory(
@@ -102,6 +91,9 @@ def request_response_factory() -> cabc.Callable[
         if correlation_id is not None:
             headers = {"X-Correlation-ID": correlation_id}
 
+        # ``create_environ`` costs about a tenth of ``falcon.Request(...)``
+        # itself, so a hand-built environ would not speed the suite up but
+        # would drift from the PEP 3333 keys real servers provide.
         environ = falcon.testing.create_environ(
             path="/test",
             headers=headers,
@@ -131,54 +123,3 @@ def isolated_context() -> cabc.Callable[[cabc.Callable[[], None]], None]:
         contextvars.copy_context().run(func)
 
     return runner
-
-
-_CTX_LOG_FORMAT = "[%(correlation_id)s][%(user_id)s] %(message)s"
-
-
-@pytest.fixture
-def logger_with_capture() -> cabc.Generator[
-    cabc.Callable[[str], tuple[logging.Logger, io.StringIO]], None, None
-]:
-    """Provide a factory for loggers with ``ContextualLogFilter`` capture.
-
-    Each call to the returned factory creates a named logger backed by a
-    ``StreamHandler`` writing to a fresh ``io.StringIO``.  The handler
-    uses a ``ContextualLogFilter`` and the standard
-    ``[%(correlation_id)s][%(user_id)s] %(message)s`` format string.
-
-    All handlers added via the factory are removed automatically when
-    the fixture tears down, preventing inter-test handler leakage.
-
-    Yields
-    ------
-    cabc.Callable[[str], tuple[logging.Logger, io.StringIO]]
-        A factory accepting a logger *name* and returning a
-        ``(logging.Logger, io.StringIO)`` pair.
-
-    """
-    cleanup: list[tuple[logging.Logger, logging.Handler, bool, int]] = []
-
-    def factory(name: str) -> tuple[logging.Logger, io.StringIO]:
-        """Build a logger and captured stream for a test."""
-        stream = io.StringIO()
-        handler = logging.StreamHandler(stream)
-        handler.setFormatter(logging.Formatter(_CTX_LOG_FORMAT))
-        handler.addFilter(ContextualLogFilter())
-
-        test_logger = logging.getLogger(name)
-        original_propagate = test_logger.propagate
-        original_level = test_logger.level
-        test_logger.addHandler(handler)
-        test_logger.setLevel(logging.INFO)
-        test_logger.propagate = False
-        cleanup.append((test_logger, handler, original_propagate, original_level))
-        return test_logger, stream
-
-    yield factory
-
-    for lgr, hdlr, orig_propagate, orig_level in cleanup:
-        lgr.removeHandler(hdlr)
-        hdlr.close()
-        lgr.propagate = orig_propagate
-        lgr.setLevel(orig_level)
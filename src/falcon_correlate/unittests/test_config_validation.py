@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import copy
+import dataclasses
+import inspect
+import pickle  # noqa: S403 - round-trips a locally built config only.
 import typing as typ
+import weakref
 
 import pytest
 
 from falcon_correlate import CorrelationIDConfig
+from falcon_correlate.middleware_config import VALID_CONFIG_KWARGS
 
 if typ.TYPE_CHECKING:
     import collections.abc as cabc
@@ -86,3 +92,62 @@ class TestCorrelationIDConfigValidation:
             CorrelationIDConfig(
                 validator=typ.cast("cabc.Callable[[str], bool]", "not-a-callable")
             )
+
+    def test_valid_config_kwargs_match_from_kwargs_parameters(self) -> None:
+        """Verify the middleware option allowlist matches the public factory.
+
+        ``VALID_CONFIG_KWARGS`` is derived from the dataclass ``init`` fields
+        and stays a ``frozenset`` so that unknown-option detection is a single
+        C-level ``issuperset`` call.
+        """
+        parameters = inspect.signature(CorrelationIDConfig.from_kwargs).parameters
+
+        assert frozenset(parameters) == VALID_CONFIG_KWARGS
+        assert isinstance(VALID_CONFIG_KWARGS, frozenset)
+
+    def test_config_uses_slots_without_instance_dict(self) -> None:
+        """Verify the config uses slots yet still accepts weak references."""
+        config = CorrelationIDConfig(trusted_sources=["10.0.0.0/8"])
+
+        assert not hasattr(config, "__dict__")
+        assert weakref.ref(config)() is config
+        assert config.trusted_sources == frozenset({"10.0.0.0/8"})
+        assert "_parsed_networks" in CorrelationIDConfig.__slots__
+        assert "__weakref__" in CorrelationIDConfig.__slots__
+
+    @pytest.mark.parametrize(
+        "clone",
+        [
+            pytest.param(copy.copy, id="copy"),
+            pytest.param(copy.deepcopy, id="deepcopy"),
+            pytest.param(
+                lambda config: pickle.loads(pickle.dumps(config)),  # noqa: S301 - trusted local payload.
+                id="pickle",
+            ),
+            pytest.param(dataclasses.replace, id="replace"),
+        ],
+    )
+    def test_slotted_config_clones_keep_parsed_networks(
+        self, clone: cabc.Callable[[CorrelationIDConfig], CorrelationIDConfig]
+    ) -> None:
+        """Verify copies of the slotted config keep the derived network field."""
+        config = CorrelationIDConfig(trusted_sources=["10.0.0.0/8"])
+
+        cloned = clone(config)
+
+        assert cloned == config
+        assert cloned._parsed_networks == config._parsed_networks
+
+    def test_repeated_sources_reuse_parsed_networks(self) -> None:
+        """Verify rebuilding a config reuses the memoised network objects."""
+        first = CorrelationIDConfig(trusted_sources=["10.0.0.0/8"])
+        second = CorrelationIDConfig.from_kwargs(trusted_sources=["10.0.0.0/8"])
+
+        assert second is not first
+        assert second._parsed_networks[0] is first._parsed_networks[0]
+
+    def test_invalid_source_raises_on_every_construction(self) -> None:
+        """Verify parse failures are re-raised rather than memoised away."""
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Invalid IP address"):
+                CorrelationIDConfig(trusted_sources=["not-an-ip"])
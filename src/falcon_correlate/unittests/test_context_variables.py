@@ -3,47 +3,42 @@
 from __future__ import annotations
 
 import contextvars
+import typing as typ
 
 import pytest
 
+import falcon_correlate
+from falcon_correlate import correlation_id_var, user_id_var
+
+if typ.TYPE_CHECKING:
+    import collections.abc as cabc
+
 
 class TestContextVariableDefinitions:
     """Tests for context variable existence, type, naming, and defaults."""
 
     def test_correlation_id_var_is_context_var(self) -> None:
         """Verify correlation_id_var is a ContextVar instance."""
-        from falcon_correlate import correlation_id_var
-
         assert isinstance(correlation_id_var, contextvars.ContextVar)
 
     def test_user_id_var_is_context_var(self) -> None:
         """Verify user_id_var is a ContextVar instance."""
-        from falcon_correlate import user_id_var
-
         assert isinstance(user_id_var, contextvars.ContextVar)
 
     def test_correlation_id_var_name(self) -> None:
         """Verify correlation_id_var has the expected name."""
-        from falcon_correlate import correlation_id_var
-
         assert correlation_id_var.name == "correlation_id"
 
     def test_user_id_var_name(self) -> None:
         """Verify user_id_var has the expected name."""
-        from falcon_correlate import user_id_var
-
         assert user_id_var.name == "user_id"
 
     def test_correlation_id_var_default_is_none(self) -> None:
         """Verify correlation_id_var defaults to None."""
-        from falcon_correlate import correlation_id_var
-
         assert correlation_id_var.get() is None
 
     def test_user_id_var_default_is_none(self) -> None:
         """Verify user_id_var defaults to None."""
-        from falcon_correlate import user_id_var
-
         assert user_id_var.get() is None
 
 
@@ -51,39 +46,45 @@ class TestContextVariableOperations:
     """Tests for context variable set, get, and reset operations."""
 
     @pytest.mark.parametrize(
-        ("var_name", "test_value"),
+        ("var", "test_value"),
         [
-            ("correlation_id_var", "test-correlation-id"),
-            ("user_id_var", "test-user-id"),
+            pytest.param(
+                correlation_id_var, "test-correlation-id", id="correlation_id_var"
+            ),
+            pytest.param(user_id_var, "test-user-id", id="user_id_var"),
         ],
     )
-    def test_context_var_set_and_get(self, var_name: str, test_value: str) -> None:
+    def test_context_var_set_and_get(
+        self,
+        var: contextvars.ContextVar[str | None],
+        test_value: str,
+        isolated_context: cabc.Callable[[cabc.Callable[[], None]], None],
+    ) -> None:
         """Verify context var set/get works and is context-isolated."""
-        import falcon_correlate
-
-        var: contextvars.ContextVar[str | None] = getattr(falcon_correlate, var_name)
 
         def _inner() -> None:
             """Exercise the request lifecycle inside an isolated context."""
-            token = var.set(test_value)
+            var.set(test_value)
             assert var.get() == test_value
-            var.reset(token)
 
-        ctx = contextvars.copy_context()
-        ctx.run(_inner)
+        isolated_context(_inner)
 
         # Values set in the copied context must not leak into the outer context.
         assert var.get() is None
 
     @pytest.mark.parametrize(
-        "var_name",
-        ["correlation_id_var", "user_id_var"],
+        "var",
+        [
+            pytest.param(correlation_id_var, id="correlation_id_var"),
+            pytest.param(user_id_var, id="user_id_var"),
+        ],
     )
-    def test_context_var_reset_restores_default(self, var_name: str) -> None:
+    def test_context_var_reset_restores_default(
+        self,
+        var: contextvars.ContextVar[str | None],
+        isolated_context: cabc.Callable[[cabc.Callable[[], None]], None],
+    ) -> None:
         """Verify resetting a context var restores None default."""
-        import falcon_correlate
-
-        var: contextvars.ContextVar[str | None] = getattr(falcon_correlate, var_name)
 
         def _inner() -> None:
             """Exercise the request lifecycle inside an isolated context."""
@@ -91,33 +92,40 @@ class TestContextVariableOperations:
             var.reset(token)
             assert var.get() is None
 
-        ctx = contextvars.copy_context()
-        ctx.run(_inner)
+        isolated_context(_inner)
 
+    def test_isolated_context_runs_do_not_share_state(
+        self,
+        isolated_context: cabc.Callable[[cabc.Callable[[], None]], None],
+    ) -> None:
+        """Verify each isolated run starts from a fresh context copy.
 
-class TestContextVariableExports:
-    """Tests for context variable public API exports."""
-
-    def test_correlation_id_var_in_all(self) -> None:
-        """Verify correlation_id_var is listed in __all__."""
-        import falcon_correlate
+        A value left set by one run must not be visible to the next, which
+        is why the fixture copies the context per call instead of reusing a
+        shared baseline ``Context``.
+        """
 
-        assert "correlation_id_var" in falcon_correlate.__all__
+        def _leave_value_set() -> None:
+            """Set the correlation ID without resetting it."""
+            correlation_id_var.set("leaked-id")
 
-    def test_user_id_var_in_all(self) -> None:
-        """Verify user_id_var is listed in __all__."""
-        import falcon_correlate
+        def _expect_default() -> None:
+            """Check the correlation ID still has its default."""
+            assert correlation_id_var.get() is None
 
-        assert "user_id_var" in falcon_correlate.__all__
+        isolated_context(_leave_value_set)
+        isolated_context(_expect_default)
 
-    def test_correlation_id_var_importable_from_root(self) -> None:
-        """Verify correlation_id_var can be imported from package root."""
-        from falcon_correlate import correlation_id_var
 
-        assert isinstance(correlation_id_var, contextvars.ContextVar)
+class TestContextVariableExports:
+    """Tests for context variable public API exports."""
 
-    def test_user_id_var_importable_from_root(self) -> None:
-        """Verify user_id_var can be imported from package root."""
-        from falcon_correlate import user_id_var
+    @pytest.mark.parametrize("name", ["correlation_id_var", "user_id_var"])
+    def test_context_var_in_all(self, name: str) -> None:
+        """Verify each context variable is listed in __all__."""
+        assert name in falcon_correlate.__all__
 
-        assert isinstance(user_id_var, contextvars.ContextVar)
+    def test_context_vars_importable_from_root(self) -> None:
+        """Verify the context variables are exported from the package root."""
+        assert falcon_correlate.correlation_id_var is correlation_id_var
+        assert falcon_correlate.user_id_var is user_id_var
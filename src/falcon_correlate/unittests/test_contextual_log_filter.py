@@ -23,21 +23,10 @@ from falcon_correlate import (
     user_id_var,
 )
 
-
-class _HasCorrelationID(typ.Protocol):
-    """Protocol for objects exposing a ``correlation_id`` attribute."""
-
-    correlation_id: str
-
-
-class _HasUserID(typ.Protocol):
-    """Protocol for objects exposing a ``user_id`` attribute."""
-
-    user_id: str
-
-
-class _HasContextIDs(_HasCorrelationID, _HasUserID, typ.Protocol):
-    """LogRecord enriched by ContextualLogFilter with both IDs."""
+# Formatters hold no per-record state, so one instance per format string is
+# shared by every test that renders captured output.
+_CTX_FORMATTER = logging.Formatter("[%(correlation_id)s][%(user_id)s] %(message)s")
+_RECOMMENDED_FORMATTER = logging.Formatter(RECOMMENDED_LOG_FORMAT)
 
 
 @dataclasses.dataclass(slots=True, frozen=True)
@@ -50,27 +39,24 @@ class PreservationTestCase:
     contextvar_value: str
 
 
-@pytest.fixture
-def preservation_case(request: pytest.FixtureRequest) -> PreservationTestCase:
-    """Fixture to receive parameterized PreservationTestCase instances.
-
-    Parameters
-    ----------
-    request : pytest.FixtureRequest
-        Fixture request supplying the parameterised ``PreservationTestCase``
-        through ``request.param``.
+@pytest.fixture(scope="module")
+def log_filter() -> ContextualLogFilter:
+    """Provide one ``ContextualLogFilter`` for the module's filter tests.
 
     Returns
     -------
-    PreservationTestCase
-        The parameterized case for the current attribute-preservation scenario.
+    ContextualLogFilter
+        A filter instance shared across tests; it holds no per-record state.
 
     """
-    return request.param
+    return ContextualLogFilter()
 
 
 def _make_log_record(msg: str = "test message") -> logging.LogRecord:
     """Create a minimal LogRecord for testing."""
+    # Construction costs about 3us, and ``copy.copy`` of a shared template
+    # record costs nearly as much; a fixture would add more setup than either.
+    # Tests also set attributes on the record, so each needs its own instance.
     return logging.LogRecord(
         name="test",
         level=logging.INFO,
@@ -82,15 +68,46 @@ def _make_log_record(msg: str = "test message") -> logging.LogRecord:
     )
 
 
+def _capture_with_filter(
+    caplog: pytest.LogCaptureFixture,
+    name: str,
+    formatter: logging.Formatter = _CTX_FORMATTER,
+) -> logging.Logger:
+    """Route a logger's INFO records through a filtered ``caplog`` handler.
+
+    Parameters
+    ----------
+    caplog : pytest.LogCaptureFixture
+        The capture fixture whose handler receives the filter and formatter.
+    name : str
+        Name of the logger the test emits through.
+    formatter : logging.Formatter
+        Formatter that renders ``caplog.text``.
+
+    Returns
+    -------
+    logging.Logger
+        The named logger, enabled at INFO for the duration of the test.
+
+    """
+    caplog.handler.addFilter(ContextualLogFilter())
+    caplog.handler.setFormatter(formatter)
+    caplog.set_level(logging.INFO, logger=name)
+    return logging.getLogger(name)
+
+
+def _assert_record_attrs(
+    record: logging.LogRecord, expected: cabc.Mapping[str, str]
+) -> None:
+    """Assert that *record* carries each expected attribute value."""
+    for name, value in expected.items():
+        actual = getattr(record, name)
+        assert actual == value, f"expected {name}={value!r}, got {actual!r}"
+
+
 class TestContextualLogFilterIsLoggingFilter:
     """Tests for ContextualLogFilter class identity."""
 
-    def test_is_logging_filter_subclass(self) -> None:
-        """Verify ContextualLogFilter is a subclass of logging.Filter."""
-        assert issubclass(ContextualLogFilter, logging.Filter), (
-            "ContextualLogFilter should be a subclass of logging.Filter"
-        )
-
     def test_can_be_instantiated(self) -> None:
         """Verify the filter can be instantiated with no arguments."""
         f = ContextualLogFilter()
@@ -112,43 +129,37 @@ class TestContextualLogFilterAttributeInjection:
     def test_injects_attribute_from_context(
         self,
         isolated_context: cabc.Callable[[cabc.Callable[[], None]], None],
+        log_filter: ContextualLogFilter,
         context_var: contextvars.ContextVar[str | None],
         context_value: str,
         attr_name: str,
     ) -> None:
         """Verify filter injects attributes from context variables."""
-        f = ContextualLogFilter()
         record = _make_log_record()
 
         def test_logic() -> None:
             """Exercise the isolated logging scenario."""
             context_var.set(context_value)
-            f.filter(record)
-            actual = getattr(record, attr_name)
-            assert actual == context_value, (
-                f"expected {attr_name}={context_value!r}, got {actual!r}"
-            )
+            log_filter.filter(record)
+            _assert_record_attrs(record, {attr_name: context_value})
 
         isolated_context(test_logic)
 
     def test_injects_both_attributes_simultaneously(
-        self, isolated_context: cabc.Callable[[cabc.Callable[[], None]], None]
+        self,
+        isolated_context: cabc.Callable[[cabc.Callable[[], None]], None],
+        log_filter: ContextualLogFilter,
     ) -> None:
         """Verify filter injects both attributes in a single call."""
-        f = ContextualLogFilter()
         record = _make_log_record()
 
         def test_logic() -> None:
             """Exercise the isolated logging scenario."""
             correlation_id_var.set("both-cid")
             user_id_var.set("both-uid")
-            f.filter(record)
-            rec = typ.cast("_HasContextIDs", record)
-            assert rec.correlation_id == "both-cid", (
-                f"expected correlation_id='both-cid', got {rec.correlation_id!r}"
-            )
-            assert rec.user_id == "both-uid", (
-                f"expected user_id='both-uid', got {rec.user_id!r}"
+            log_filter.filter(record)
+            _assert_record_attrs(
+                record, {"correlation_id": "both-cid", "user_id": "both-uid"}
             )
 
         isolated_context(test_logic)
@@ -158,50 +169,23 @@ class TestContextualLogFilterPlaceholder:
     """Tests for placeholder values when context is empty."""
 
     @pytest.mark.parametrize(
-        "check_attrs",
+        ("set_correlation", "set_user"),
         [
-            ("correlation_id",),
-            ("user_id",),
-            ("correlation_id", "user_id"),
+            (False, False),
+            (True, False),
+            (False, True),
+            (True, True),
         ],
-        ids=["correlation_id_only", "user_id_only", "both_attrs"],
+        ids=["both_unset", "correlation_id_none", "user_id_none", "both_none"],
     )
-    def test_placeholder_when_context_not_set(
-        self,
-        isolated_context: cabc.Callable[[cabc.Callable[[], None]], None],
-        check_attrs: tuple[str, ...],
-    ) -> None:
-        """Verify placeholder used for attributes when context not set."""
-        f = ContextualLogFilter()
-        record = _make_log_record()
-
-        def test_logic() -> None:
-            """Exercise the isolated logging scenario."""
-            f.filter(record)
-            for attr in check_attrs:
-                actual = getattr(record, attr)
-                assert actual == "-", f"expected {attr}='-', got {actual!r}"
-
-        isolated_context(test_logic)
-
-    @pytest.mark.parametrize(
-        ("set_correlation", "set_user", "check_attrs"),
-        [
-            (True, False, ("correlation_id",)),
-            (False, True, ("user_id",)),
-            (True, True, ("correlation_id", "user_id")),
-        ],
-        ids=["correlation_id_none", "user_id_none", "both_none"],
-    )
-    def test_placeholder_when_context_explicit_none(
+    def test_placeholder_when_context_empty(
         self,
         isolated_context: cabc.Callable[[cabc.Callable[[], None]], None],
+        log_filter: ContextualLogFilter,
         set_correlation: bool,  # noqa: FBT001 -  bool param injected by pytest parametrize; remove when ruff supports parametrize-aware FBT001 exemption
         set_user: bool,  # noqa: FBT001 -  bool param injected by pytest parametrize; remove when ruff supports parametrize-aware FBT001 exemption
-        check_attrs: tuple[str, ...],
     ) -> None:
-        """Verify placeholder used when context vars are explicitly set to None."""
-        f = ContextualLogFilter()
+        """Verify placeholder used when context vars are unset or set to None."""
         record = _make_log_record()
 
         def test_logic() -> None:
@@ -211,10 +195,8 @@ class TestContextualLogFilterPlaceholder:
             if set_user:
                 user_id_var.set(None)
 
-            f.filter(record)
-            for attr in check_attrs:
-                actual = getattr(record, attr)
-                assert actual == "-", f"expected {attr}='-', got {actual!r}"
+            log_filter.filter(record)
+            _assert_record_attrs(record, {"correlation_id": "-", "user_id": "-"})
 
         isolated_context(test_logic)
 
@@ -233,10 +215,10 @@ class TestContextualLogFilterReturnValue:
     def test_filter_always_returns_true(
         self,
         isolated_context: cabc.Callable[[cabc.Callable[[], None]], None],
+        log_filter: ContextualLogFilter,
         populated: bool,  # noqa: FBT001 -  bool param injected by pytest parametrize; remove when ruff supports parametrize-aware FBT001 exemption
     ) -> None:
         """Verify filter() always returns True regardless of context state."""
-        f = ContextualLogFilter()
         record = _make_log_record()
 
         def test_logic() -> None:
@@ -244,7 +226,7 @@ class TestContextualLogFilterReturnValue:
             if populated:
                 correlation_id_var.set("cid")
                 user_id_var.set("uid")
-            result = f.filter(record)
+            result = log_filter.filter(record)
             assert result is True, f"expected filter() to return True, got {result!r}"
 
         isolated_context(test_logic)
@@ -270,71 +252,102 @@ class TestContextualLogFilterPreservesExistingAttributes:
             ),
         ],
         ids=["correlation_id", "user_id"],
-        indirect=True,
     )
     def test_preserves_existing_attribute(
         self,
         isolated_context: cabc.Callable[[cabc.Callable[[], None]], None],
+        log_filter: ContextualLogFilter,
         preservation_case: PreservationTestCase,
     ) -> None:
         """Verify filter does not overwrite a pre-existing attribute."""
-        f = ContextualLogFilter()
         record = _make_log_record()
         setattr(record, preservation_case.attr_name, preservation_case.existing_value)
 
         def test_logic() -> None:
             """Exercise the isolated logging scenario."""
             preservation_case.context_var.set(preservation_case.contextvar_value)
-            f.filter(record)
-            actual = getattr(record, preservation_case.attr_name)
-            expected = preservation_case.existing_value
-            assert actual == expected, (
-                f"expected {preservation_case.attr_name}={expected!r}, got {actual!r}"
+            log_filter.filter(record)
+            _assert_record_attrs(
+                record,
+                {preservation_case.attr_name: preservation_case.existing_value},
             )
 
         isolated_context(test_logic)
 
     def test_preserves_when_contextvar_unset(
-        self, isolated_context: cabc.Callable[[cabc.Callable[[], None]], None]
+        self,
+        isolated_context: cabc.Callable[[cabc.Callable[[], None]], None],
+        log_filter: ContextualLogFilter,
     ) -> None:
         """Verify caller-provided ID survives even when contextvar is unset."""
-        f = ContextualLogFilter()
         record = _make_log_record()
         record.correlation_id = "explicit-cid"
         record.user_id = "explicit-uid"
 
         def test_logic() -> None:
             """Exercise the isolated logging scenario."""
-            f.filter(record)
-            rec = typ.cast("_HasContextIDs", record)
-            assert rec.correlation_id == "explicit-cid", (
-                f"expected correlation_id='explicit-cid', got {rec.correlation_id!r}"
-            )
-            assert rec.user_id == "explicit-uid", (
-                f"expected user_id='explicit-uid', got {rec.user_id!r}"
+            log_filter.filter(record)
+            _assert_record_attrs(
+                record, {"correlation_id": "explicit-cid", "user_id": "explicit-uid"}
             )
 
         isolated_context(test_logic)
 
     def test_fills_missing_attribute_alongside_existing(
-        self, isolated_context: cabc.Callable[[cabc.Callable[[], None]], None]
+        self,
+        isolated_context: cabc.Callable[[cabc.Callable[[], None]], None],
+        log_filter: ContextualLogFilter,
     ) -> None:
         """Verify filter fills one attr from contextvar while preserving the other."""
-        f = ContextualLogFilter()
         record = _make_log_record()
         record.correlation_id = "caller-cid"
 
         def test_logic() -> None:
             """Exercise the isolated logging scenario."""
             user_id_var.set("contextvar-uid")
-            f.filter(record)
-            rec = typ.cast("_HasContextIDs", record)
-            assert rec.correlation_id == "caller-cid", (
-                f"expected correlation_id='caller-cid', got {rec.correlation_id!r}"
+            log_filter.filter(record)
+            _assert_record_attrs(
+                record, {"correlation_id": "caller-cid", "user_id": "contextvar-uid"}
             )
-            assert rec.user_id == "contextvar-uid", (
-                f"expected user_id='contextvar-uid', got {rec.user_id!r}"
+
+        isolated_context(test_logic)
+
+    def test_preserves_attributes_defined_on_record_subclass(
+        self,
+        isolated_context: cabc.Callable[[cabc.Callable[[], None]], None],
+        log_filter: ContextualLogFilter,
+    ) -> None:
+        """Verify class attributes and properties on a record subclass survive."""
+
+        class _ServiceRecord(logging.LogRecord):
+            """Record type that supplies both IDs at class level."""
+
+            correlation_id = "class-cid"
+
+            @property
+            def user_id(self) -> str:
+                """User ID derived by the record factory."""
+                return "property-uid"
+
+        record = _ServiceRecord(
+            name="test",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=1,
+            msg="test message",
+            args=None,
+            exc_info=None,
+        )
+
+        def test_logic() -> None:
+            """Exercise the isolated logging scenario."""
+            correlation_id_var.set("contextvar-cid")
+            user_id_var.set("contextvar-uid")
+            log_filter.filter(record)
+            _assert_record_attrs(
+                record, {"correlation_id": "class-cid", "user_id": "property-uid"}
             )
+            assert "correlation_id" not in vars(record)
 
         isolated_context(test_logic)
 
@@ -345,11 +358,11 @@ class TestContextualLogFilterLoggingIntegration:
     def test_filter_works_with_logger(
         self,
         isolated_context: cabc.Callable[[cabc.Callable[[], None]], None],
-        logger_with_capture: cabc.Callable[[str], tuple[logging.Logger, io.StringIO]],
+        caplog: pytest.LogCaptureFixture,
     ) -> None:
         """Verify filter enriches records emitted through a logger."""
-        test_logger, stream = logger_with_capture(
-            "test_contextual_log_filter_integration",
+        test_logger = _capture_with_filter(
+            caplog, "test_contextual_log_filter_integration"
         )
 
         def test_logic() -> None:
@@ -360,7 +373,7 @@ class TestContextualLogFilterLoggingIntegration:
 
         isolated_context(test_logic)
 
-        output = stream.getvalue()
+        output = caplog.text
         assert "[log-cid-001]" in output, (
             f"expected '[log-cid-001]' in output, got {output!r}"
         )
@@ -375,6 +388,9 @@ class TestContextualLogFilterLoggingIntegration:
         self, isolated_context: cabc.Callable[[cabc.Callable[[], None]], None]
     ) -> None:
         """Verify filter works when configured via dictConfig."""
+        # ``dictConfig`` costs about 0.2ms here. Keep the real call rather
+        # than resolving the ``"()"`` path by hand: it is the configuration
+        # route the users' guide documents, including the ``filters`` wiring.
         config = {
             "version": 1,
             "disable_existing_loggers": False,
@@ -406,11 +422,12 @@ class TestContextualLogFilterLoggingIntegration:
         logging.config.dictConfig(config)
         test_logger = logging.getLogger("test_dictconfig_logger")
 
+        # The config declares a single handler; unpacking fails loudly if
+        # dictConfig ever attaches more. Swap its stdout stream for capture.
+        (handler,) = test_logger.handlers
+        assert isinstance(handler, logging.StreamHandler)
         stream = io.StringIO()
-        # Replace the stdout handler with our string stream for capture.
-        for h in test_logger.handlers:
-            if isinstance(h, logging.StreamHandler):
-                h.stream = stream
+        handler.stream = stream
 
         try:
 
@@ -436,12 +453,10 @@ class TestContextualLogFilterLoggingIntegration:
     def test_extra_kwarg_preserved_over_contextvar(
         self,
         isolated_context: cabc.Callable[[cabc.Callable[[], None]], None],
-        logger_with_capture: cabc.Callable[[str], tuple[logging.Logger, io.StringIO]],
+        caplog: pytest.LogCaptureFixture,
     ) -> None:
         """Verify extra= correlation_id is preserved when logging through a logger."""
-        test_logger, stream = logger_with_capture(
-            "test_contextual_extra_preserved",
-        )
+        test_logger = _capture_with_filter(caplog, "test_contextual_extra_preserved")
 
         def test_logic() -> None:
             """Exercise the isolated logging scenario."""
@@ -454,7 +469,7 @@ class TestContextualLogFilterLoggingIntegration:
 
         isolated_context(test_logic)
 
-        output = stream.getvalue()
+        output = caplog.text
         assert "[explicit-cid]" in output, (
             f"expected '[explicit-cid]' in output, got {output!r}"
         )
@@ -464,14 +479,15 @@ class TestContextualLogFilterLoggingIntegration:
 
 
 class TestContextualLogFilterExports:
-    """Tests for ContextualLogFilter public API exports."""
+    """Tests for ContextualLogFilter and log format public API exports."""
 
-    def test_contextual_log_filter_in_all(self) -> None:
-        """Verify ContextualLogFilter is listed in __all__."""
+    @pytest.mark.parametrize("name", ["ContextualLogFilter", "RECOMMENDED_LOG_FORMAT"])
+    def test_logging_export_in_all(self, name: str) -> None:
+        """Verify each logging helper is listed in __all__."""
         import falcon_correlate
 
-        assert "ContextualLogFilter" in falcon_correlate.__all__, (
-            "ContextualLogFilter is missing from falcon_correlate.__all__"
+        assert name in falcon_correlate.__all__, (
+            f"{name} is missing from falcon_correlate.__all__"
         )
 
     def test_contextual_log_filter_importable_from_root(self) -> None:
@@ -486,14 +502,6 @@ class TestContextualLogFilterExports:
 class TestRecommendedLogFormat:
     """Tests for RECOMMENDED_LOG_FORMAT constant."""
 
-    def test_recommended_log_format_in_all(self) -> None:
-        """Verify RECOMMENDED_LOG_FORMAT is listed in __all__."""
-        import falcon_correlate
-
-        assert "RECOMMENDED_LOG_FORMAT" in falcon_correlate.__all__, (
-            "RECOMMENDED_LOG_FORMAT missing from falcon_correlate.__all__"
-        )
-
     def test_recommended_log_format_importable_from_root(self) -> None:
         """Verify RECOMMENDED_LOG_FORMAT can be imported from package root."""
         from falcon_correlate import RECOMMENDED_LOG_FORMAT as IMPORTED_FMT
@@ -516,43 +524,31 @@ class TestRecommendedLogFormat:
     def test_recommended_log_format_usable_with_formatter(
         self,
         isolated_context: cabc.Callable[[cabc.Callable[[], None]], None],
+        caplog: pytest.LogCaptureFixture,
     ) -> None:
         """Verify the constant works with Formatter and ContextualLogFilter."""
-        stream = io.StringIO()
-        handler = logging.StreamHandler(stream)
-        handler.setFormatter(
-            logging.Formatter(RECOMMENDED_LOG_FORMAT),
+        test_logger = _capture_with_filter(
+            caplog, "test_recommended_fmt", _RECOMMENDED_FORMATTER
         )
-        handler.addFilter(ContextualLogFilter())
 
-        test_logger = logging.getLogger("test_recommended_fmt")
-        test_logger.addHandler(handler)
-        test_logger.setLevel(logging.INFO)
-        test_logger.propagate = False
-
-        try:
-
-            def test_logic() -> None:
-                """Exercise the isolated logging scenario."""
-                correlation_id_var.set("rec-cid-001")
-                user_id_var.set("rec-uid-001")
-                test_logger.info("recommended format test")
+        def test_logic() -> None:
+            """Exercise the isolated logging scenario."""
+            correlation_id_var.set("rec-cid-001")
+            user_id_var.set("rec-uid-001")
+            test_logger.info("recommended format test")
 
-            isolated_context(test_logic)
+        isolated_context(test_logic)
 
-            output = stream.getvalue()
-            assert "[rec-cid-001]" in output, (
-                f"expected '[rec-cid-001]' in output, got {output!r}"
-            )
-            assert "[rec-uid-001]" in output, (
-                f"expected '[rec-uid-001]' in output, got {output!r}"
-            )
-            assert "recommended format test" in output, (
-                f"expected message in output, got {output!r}"
-            )
-        finally:
-            test_logger.removeHandler(handler)
-            handler.close()
+        output = caplog.text
+        assert "[rec-cid-001]" in output, (
+            f"expected '[rec-cid-001]' in output, got {output!r}"
+        )
+        assert "[rec-uid-001]" in output, (
+            f"expected '[rec-uid-001]' in output, got {output!r}"
+        )
+        assert "recommended format test" in output, (
+            f"expected message in output, got {output!r}"
+        )
 
     def test_recommended_log_format_works_in_dictconfig(
         self,
@@ -592,10 +588,12 @@ class TestRecommendedLogFormat:
             "test_recommended_dictconfig",
         )
 
+        # The config declares a single handler; unpacking fails loudly if
+        # dictConfig ever attaches more. Swap its stdout stream for capture.
+        (handler,) = test_logger.handlers
+        assert isinstance(handler, logging.StreamHandler)
         stream = io.StringIO()
-        for h in test_logger.handlers:
-            if isinstance(h, logging.StreamHandler):
-                h.stream = stream
+        handler.stream = stream
 
         try:
 
@@ -7,16 +7,17 @@ import threading
 import typing as typ
 from concurrent.futures import ThreadPoolExecutor
 
+import falcon
+import falcon.testing
 import pytest
 
 from falcon_correlate import CorrelationIDMiddleware, correlation_id_var
 from falcon_correlate.middleware import _CORRELATION_ID_RESET_TOKEN_ATTR
+from tests.conftest import CorrelationEchoResource
 
 if typ.TYPE_CHECKING:
     import collections.abc as cabc
 
-    import falcon
-
 
 _FOREIGN_VAR: contextvars.ContextVar[str | None] = contextvars.ContextVar(
     "foreign",
@@ -24,6 +25,18 @@ _FOREIGN_VAR: contextvars.ContextVar[str | None] = contextvars.ContextVar(
 )
 
 
+class _SlottedContext:
+    """Request context type without an instance ``__dict__``."""
+
+    __slots__ = (_CORRELATION_ID_RESET_TOKEN_ATTR, "correlation_id")
+
+
+class _SlottedContextRequest(falcon.Request):
+    """Falcon request whose ``context_type`` only allows declared attributes."""
+
+    context_type = _SlottedContext
+
+
 def _make_non_token_bad_token() -> tuple[object, cabc.Callable[[], None]]:
     """Return a non-Token sentinel and a no-op cleanup."""
     return object(), lambda: None
@@ -291,3 +304,25 @@ class TestContextVariableLifecycle:
         assert correlation_id_var.get() is None, (
             "Expected top-level correlation_id_var to remain None after concurrent run"
         )
+
+    def test_lifecycle_supports_custom_context_type_without_dict(self) -> None:
+        """Verify IDs are stored by attribute, not through ``context.__dict__``."""
+        app = falcon.App(
+            request_type=_SlottedContextRequest,
+            middleware=[
+                CorrelationIDMiddleware(
+                    trusted_sources=["127.0.0.1"],
+                    generator=lambda: "generated-id",
+                )
+            ],
+        )
+        app.add_route("/correlation", CorrelationEchoResource())
+        client = falcon.testing.TestClient(app)
+
+        response = client.simulate_get(
+            "/correlation", headers={"X-Correlation-ID": "incoming-id"}
+        )
+
+        assert response.json["correlation_id"] == "incoming-id"
+        assert response.headers["X-Correlation-ID"] == "incoming-id"
+        assert correlation_id_var.get() is None
@@ -205,6 +205,29 @@ class TestGeneratorInvocationWhenSourceUntrusted:
             headers={"X-Correlation-ID": incoming_header},
         )
 
+    def test_header_not_read_without_trusted_sources(
+        self,
+        request_response_factory: cabc.Callable[
+            ..., tuple[falcon.Request, falcon.Response]
+        ],
+        isolated_context: cabc.Callable[[cabc.Callable[[], None]], None],
+    ) -> None:
+        """Verify the header lookup is skipped when no source can be trusted."""
+        middleware = CorrelationIDMiddleware(generator=lambda: "generated-id")
+        req, resp = request_response_factory(correlation_id="never-read")
+
+        environ = mock.MagicMock(wraps=req.env)
+        req.env = environ
+
+        def _inner() -> None:
+            """Process the request while recording environ lookups."""
+            middleware.process_request(req, resp)
+
+            environ.get.assert_not_called()
+            assert req.context.correlation_id == "generated-id"
+
+        isolated_context(_inner)
+
     def test_incoming_id_rejected_from_untrusted_source(
         self,
         create_test_client: cabc.Callable[..., falcon.testing.TestClient],
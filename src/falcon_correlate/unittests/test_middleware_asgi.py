@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import inspect
+from unittest import mock
 
 import pytest
 
@@ -106,6 +107,25 @@ class TestCorrelationIDMiddlewareASGIRequestLifecycle:
             f"but got {resp.get_header('X-Correlation-ID')!r}"
         )
 
+    @pytest.mark.asyncio
+    async def test_process_request_skips_header_without_trusted_sources(
+        self,
+    ) -> None:
+        """Verify ASGI requests never read the header when nothing is trusted."""
+        middleware = CorrelationIDMiddlewareASGI(generator=lambda: "generated-asgi")
+        req = _Request(headers={"X-Correlation-ID": "never-read"})
+        resp = _Response()
+
+        with mock.patch.object(req, "get_header", wraps=req.get_header) as get_header:
+            await _process_request(middleware, req, resp)
+
+        get_header.assert_not_called()
+        assert req.context.correlation_id == "generated-asgi", (
+            "expected req.context.correlation_id to be 'generated-asgi' but got "
+            f"{req.context.correlation_id!r}"
+        )
+        await _process_response(middleware, req, resp)
+
     @pytest.mark.parametrize(
         ("middleware", "req", "expected_id"),
         [
@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
+import typing as typ
+
 import falcon
 import falcon.testing
 import pytest
 
 from falcon_correlate import CorrelationIDMiddleware
+from falcon_correlate.middleware import _wsgi_env_key
 from tests.conftest import CorrelationEchoResource
 
+if typ.TYPE_CHECKING:
+    import collections.abc as cabc
+
 
 class TestCorrelationIDHeaderRetrieval:
     """Tests for correlation ID header retrieval.
@@ -89,3 +95,33 @@ class TestCorrelationIDHeaderRetrieval:
 
         assert response.json["has_correlation_id"] is True
         assert response.json["correlation_id"] == "cid-123"
+
+    @pytest.mark.parametrize(
+        "header_name",
+        ["X-Correlation-ID", "x-request-id", "Traceparent", "Content-Type"],
+    )
+    def test_wsgi_env_key_matches_falcon_header_lookup(self, header_name: str) -> None:
+        """Verify the precomputed environ key finds what ``get_header`` finds."""
+        req = falcon.testing.create_req(headers={header_name: "cid-123"})
+
+        assert req.env.get(_wsgi_env_key(header_name)) == req.get_header(header_name)
+
+    def test_lowercase_header_name_is_read_from_environ(
+        self,
+        request_response_factory: cabc.Callable[
+            ..., tuple[falcon.Request, falcon.Response]
+        ],
+        isolated_context: cabc.Callable[[cabc.Callable[[], None]], None],
+    ) -> None:
+        """Verify a lowercase configured header name is matched case-insensitively."""
+        middleware = CorrelationIDMiddleware(
+            header_name="x-correlation-id", trusted_sources=["127.0.0.1"]
+        )
+        req, resp = request_response_factory(correlation_id="cid-123")
+
+        def _inner() -> None:
+            """Process the request and check the incoming ID was accepted."""
+            middleware.process_request(req, resp)
+            assert req.context.correlation_id == "cid-123"
+
+        isolated_context(_inner)
@@ -3,8 +3,12 @@
 from __future__ import annotations
 
 import inspect
+import weakref
+from unittest import mock
 
-from falcon_correlate import CorrelationIDMiddleware
+import pytest
+
+from falcon_correlate import CorrelationIDMiddleware, CorrelationIDMiddlewareASGI
 
 
 class TestCorrelationIDMiddlewareInstantiation:
@@ -20,6 +24,23 @@ class TestCorrelationIDMiddlewareInstantiation:
         middleware = CorrelationIDMiddleware()
         assert isinstance(middleware, CorrelationIDMiddleware)
 
+    @pytest.mark.parametrize(
+        "middleware_cls", [CorrelationIDMiddleware, CorrelationIDMiddlewareASGI]
+    )
+    def test_middleware_instances_stay_open_for_extension(
+        self,
+        middleware_cls: type[CorrelationIDMiddleware | CorrelationIDMiddlewareASGI],
+    ) -> None:
+        """Verify instances accept weak references, patches and ad-hoc attributes."""
+        middleware = middleware_cls(trusted_sources=["10.0.0.0/8"])
+
+        assert weakref.ref(middleware)() is middleware
+        with mock.patch.object(middleware, "_is_trusted_source", return_value=True):
+            assert middleware._is_trusted_source("192.0.2.1") is True
+        assert hasattr(middleware, "__dict__")
+        vars(middleware)["app_label"] = "orders"
+        assert vars(middleware)["app_label"] == "orders"
+
 
 class TestCorrelationIDMiddlewareInterface:
     """Tests for CorrelationIDMiddleware method interface."""
@@ -184,6 +184,7 @@ def test_process_request_selection_property(
 @settings(suppress_health_check=[HealthCheck.function_scoped_fixture])
 def test_process_response_cleanup_property(
     request_response_factory: cabc.Callable[..., tuple[typ.Any, typ.Any]],
+    isolated_context: cabc.Callable[[cabc.Callable[[], None]], None],
     should_fail: bool,  # noqa: FBT001 - generated property input
     correlation_id: str,
 ) -> None:
@@ -230,7 +231,7 @@ def test_process_response_cleanup_property(
             f"{getattr(req.context, _CORRELATION_ID_RESET_TOKEN_ATTR, None)!r}"
         )
 
-    contextvars.copy_context().run(_inner)
+    isolated_context(_inner)
 
 
 @given(task_count=st.integers(min_value=1, max_value=8))
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import typing as typ
+from unittest import mock
 
 import falcon
 import falcon.testing
@@ -394,3 +395,37 @@ class TestCorrelationIDResponseHeader:
 
         isolated_context(_inner)
         assert "Correlation ID response header echoed" in caplog.text
+
+    @pytest.mark.parametrize("echo_header_in_response", [True, False])
+    def test_process_response_skips_debug_context_when_debug_disabled(
+        self,
+        caplog: pytest.LogCaptureFixture,
+        echo_header_in_response: bool,  # noqa: FBT001 - parametrized flag.
+        isolated_context: cabc.Callable[[cabc.Callable[[], None]], None],
+        request_response_factory: cabc.Callable[
+            ..., tuple[falcon.Request, falcon.Response]
+        ],
+    ) -> None:
+        """Verify per-response debug records cost nothing above debug level."""
+        middleware = CorrelationIDMiddleware(
+            echo_header_in_response=echo_header_in_response
+        )
+        caplog.set_level(logging.INFO, logger=_LOGGER_NAME)
+
+        def _inner() -> None:
+            """Run one request lifecycle while watching log-context builds."""
+            req, resp = request_response_factory()
+            with mock.patch.object(
+                CorrelationIDMiddleware, "_log_context", autospec=True
+            ) as log_context:
+                middleware.process_request(req, resp)
+                middleware.process_response(
+                    req, resp, resource=None, req_succeeded=True
+                )
+
+            log_context.assert_not_called()
+
+        isolated_context(_inner)
+        assert not caplog.records, (
+            f"expected no middleware log records but got {caplog.records!r}"
+        )
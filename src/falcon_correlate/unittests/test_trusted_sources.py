@@ -9,6 +9,7 @@ import falcon.testing
 import pytest
 
 from falcon_correlate import CorrelationIDMiddleware
+from falcon_correlate.middleware import _parse_remote_addr
 from tests.conftest import CorrelationEchoResource
 
 if typ.TYPE_CHECKING:
@@ -84,6 +85,18 @@ class TestTrustedSourceChecking:
         middleware = CorrelationIDMiddleware(trusted_sources=["10.0.0.1"])
         assert middleware._is_trusted_source("not-an-ip") is False
 
+    def test_remote_addr_parsing_is_memoised(self) -> None:
+        """Verify repeated remote addresses, even malformed ones, hit the cache."""
+        middleware = CorrelationIDMiddleware(trusted_sources=["10.0.0.1"])
+        _parse_remote_addr.cache_clear()
+        for remote_addr in ("10.0.0.1", "not-an-ip", "10.0.0.1", "not-an-ip"):
+            middleware._is_trusted_source(remote_addr)
+        assert _parse_remote_addr.cache_info().hits == 2
+
+    def test_remote_addr_parse_cache_is_bounded(self) -> None:
+        """Verify the parse cache has a finite size so client churn cannot grow it."""
+        assert _parse_remote_addr.cache_parameters()["maxsize"] == 4096
+
     # Multiple sources
 
     def test_multiple_sources_first_match_is_trusted(self) -> None:
@@ -144,6 +157,30 @@ class TestTrustedSourceChecking:
         )
         assert middleware._is_trusted_source("10.0.0.1") is False
 
+    def test_ipv4_mapped_ipv6_addr_not_in_ipv4_sources(self) -> None:
+        """Verify an IPv4-mapped IPv6 address does not match IPv4 sources."""
+        middleware = CorrelationIDMiddleware(trusted_sources=["10.0.0.0/8"])
+        assert middleware._is_trusted_source("::ffff:10.0.0.1") is False
+
+    def test_scoped_ipv6_addr_matches_by_address(self) -> None:
+        """Verify a zone-scoped IPv6 peer is matched on its address part."""
+        middleware = CorrelationIDMiddleware(trusted_sources=["fe80::/10"])
+        assert middleware._is_trusted_source("fe80::1%eth0") is True
+
+    @pytest.mark.parametrize(
+        ("source", "remote_addr"),
+        [
+            pytest.param("0.0.0.0/0", "203.0.113.7", id="ipv4_any"),
+            pytest.param("::/0", "2001:db8::1", id="ipv6_any"),
+        ],
+    )
+    def test_zero_length_prefix_trusts_whole_family(
+        self, source: str, remote_addr: str
+    ) -> None:
+        """Verify a zero-length prefix matches every address of its family."""
+        middleware = CorrelationIDMiddleware(trusted_sources=[source])
+        assert middleware._is_trusted_source(remote_addr) is True
+
 
 class TestTrustedSourceConfigValidation:
     """Tests for IP/CIDR validation in CorrelationIDConfig."""
@@ -165,6 +202,11 @@ class TestTrustedSourceConfigValidation:
         with pytest.raises(ValueError, match="has host bits set"):
             CorrelationIDMiddleware(trusted_sources=["10.0.0.5/24"])
 
+    def test_source_quoting_host_bits_phrase_is_reported_as_invalid(self) -> None:
+        """Verify parse errors that echo the host-bits phrase are not misreported."""
+        with pytest.raises(ValueError, match="Invalid IP address or CIDR"):
+            CorrelationIDMiddleware(trusted_sources=["has host bits set"])
+
     # IPv6 validation tests
 
     def test_invalid_ipv6_raises_value_error(self) -> None:
@@ -270,6 +312,16 @@ class TestTrustedSourceIntegration:
                 {"X-Correlation-ID": "incoming-id"},
                 id="untrusted_source",
             ),
+            pytest.param(
+                "forwarded_headers_spoof_trusted_peer",
+                ["10.0.0.1"],
+                {
+                    "X-Correlation-ID": "incoming-id",
+                    "X-Forwarded-For": "10.0.0.1",
+                    "Forwarded": "for=10.0.0.1",
+                },
+                id="forwarded_headers_spoof_trusted_peer",
+            ),
             pytest.param(
                 "no_trusted_sources",
                 [],
@@ -315,3 +367,21 @@ class TestTrustedSourceIntegration:
             headers={"X-Correlation-ID": "cidr-matched-id"},
         )
         assert response.json["correlation_id"] == "cidr-matched-id"
+
+    def test_missing_remote_addr_falls_back_like_falcon(
+        self,
+        isolated_context: cabc.Callable[[cabc.Callable[[], None]], None],
+    ) -> None:
+        """Verify an environ without REMOTE_ADDR uses Falcon's loopback default."""
+        middleware = CorrelationIDMiddleware(trusted_sources=["127.0.0.1"])
+        req = falcon.testing.create_req(headers={"X-Correlation-ID": "incoming-id"})
+        resp = falcon.Response()
+        req.env.pop("REMOTE_ADDR", None)
+
+        def _inner() -> None:
+            """Process the request and check the peer was treated as loopback."""
+            middleware.process_request(req, resp)
+            assert req.remote_addr == "127.0.0.1"
+            assert req.context.correlation_id == "incoming-id"
+
+        isolated_context(_inner)
@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
+import itertools
 import sys
+import time
 import typing as typ
 from types import SimpleNamespace
 
 if typ.TYPE_CHECKING:
     import pytest
 
-from falcon_correlate import default_uuid7_generator
+from falcon_correlate import default_uuid7_generator, middleware_utils
 from falcon_correlate.unittests.uuid7_helpers import assert_uuid7_hex
 
 
@@ -27,6 +29,18 @@ class TestDefaultUUID7Generator:
         second = default_uuid7_generator()
         assert first != second, "expected unique UUIDv7 values across calls"
 
+    def test_embeds_generation_timestamp(self) -> None:
+        """Verify IDs carry the time they were requested, not a buffered one."""
+        before_ms = time.time_ns() // 1_000_000
+        value = default_uuid7_generator()
+        after_ms = time.time_ns() // 1_000_000
+
+        # The leading 48 bits of a UUIDv7 are the Unix timestamp in ms
+        timestamp_ms = int(value[:12], 16)
+        assert before_ms <= timestamp_ms <= after_ms, (
+            "expected the UUIDv7 timestamp to fall within the generator call"
+        )
+
     def test_falls_back_when_uuid7_missing(
         self, monkeypatch: pytest.MonkeyPatch
     ) -> None:
@@ -40,5 +54,76 @@ class TestDefaultUUID7Generator:
         )
         monkeypatch.setitem(sys.modules, "uuid_utils", fake_uuid_utils)
 
+        resolved = middleware_utils._resolve_uuid7()
+        assert resolved().hex == sentinel_hex, (
+            "expected uuid_utils.uuid7 to be resolved as the fallback"
+        )
+
+        monkeypatch.setattr(middleware_utils, "_uuid7", resolved)
         value = default_uuid7_generator()
         assert value == sentinel_hex, "expected fallback UUIDv7 value to be used"
+
+    def test_prefers_stdlib_uuid7_when_present(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify the standard library uuid7 is resolved when it exists."""
+        stdlib_hex = "0" * 12 + "7" + "0" * 3 + "8" + "0" * 15
+        stdlib_calls: list[None] = []
+
+        def _stdlib_uuid7() -> SimpleNamespace:
+            """Stand in for ``uuid.uuid7`` and record each call."""
+            stdlib_calls.append(None)
+            return SimpleNamespace(hex=stdlib_hex)
+
+        monkeypatch.setattr(
+            "falcon_correlate.middleware_utils.uuid.uuid7",
+            _stdlib_uuid7,
+            raising=False,
+        )
+        fake_uuid_utils = SimpleNamespace(
+            uuid7=lambda: SimpleNamespace(hex="f" * 32),
+        )
+        monkeypatch.setitem(sys.modules, "uuid_utils", fake_uuid_utils)
+
+        resolved = middleware_utils._resolve_uuid7()
+        assert not stdlib_calls, "expected resolution not to call uuid7"
+
+        value = resolved().hex
+        assert value == stdlib_hex, (
+            "expected uuid.uuid7 to take precedence over uuid_utils"
+        )
+        assert_uuid7_hex(value)
+
+    def test_backend_is_not_resolved_per_call(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify generation uses the import-time binding, not a fresh lookup."""
+        late_calls: list[None] = []
+
+        def _late_uuid7() -> SimpleNamespace:
+            """Stand in for a ``uuid.uuid7`` installed after import."""
+            late_calls.append(None)
+            return SimpleNamespace(hex="f" * 32)
+
+        monkeypatch.setattr(
+            "falcon_correlate.middleware_utils.uuid.uuid7",
+            _late_uuid7,
+            raising=False,
+        )
+
+        for _ in range(10):
+            assert_uuid7_hex(default_uuid7_generator())
+
+        assert not late_calls, "expected the generator to ignore a late uuid.uuid7"
+
+    def test_values_increase_within_a_burst(self) -> None:
+        """Verify IDs generated back to back never step back in time.
+
+        Several IDs can share a millisecond and the remaining bits are not
+        guaranteed to be ordered, so only the 48-bit timestamp is compared.
+        """
+        timestamps = [int(default_uuid7_generator()[:12], 16) for _ in range(1000)]
+
+        assert all(
+            earlier <= later for earlier, later in itertools.pairwise(timestamps)
+        ), "expected UUIDv7 timestamps generated in one burst to be monotonic"
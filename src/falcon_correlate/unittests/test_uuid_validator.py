@@ -225,6 +225,32 @@ class TestDefaultUUIDValidatorInvalidFormats:
             f"{description} should be rejected"
         )
 
+    @pytest.mark.parametrize(
+        ("value", "description"),
+        [
+            pytest.param(
+                "550e8400_29b41d4a716446655440000",
+                "digit-group underscore accepted by int()",
+                id="underscore",
+            ),
+            pytest.param(
+                "+50e8400e29b41d4a716446655440000",
+                "leading sign accepted by int()",
+                id="leading_sign",
+            ),
+            pytest.param(
+                "550e8400e29b41d4a7164466554400\u06600",
+                "non-ASCII decimal digit",
+                id="non_ascii_digit",
+            ),
+        ],
+    )
+    def test_rejects_non_hex_int_literals(self, value: str, description: str) -> None:
+        """Verify validator rejects characters that ``int(value, 16)`` tolerates."""
+        assert default_uuid_validator(value) is False, (
+            f"{description} should be rejected"
+        )
+
     def test_rejects_random_string(self) -> None:
         """Verify validator rejects random non-UUID strings."""
         assert default_uuid_validator("not-a-uuid-at-all") is False, (
@@ -268,6 +294,26 @@ class TestDefaultUUIDValidatorVersionEnforcement:
         )
 
 
+class TestDefaultUUIDValidatorVariantEnforcement:
+    """Tests for RFC 4122/9562 variant enforcement."""
+
+    @pytest.mark.parametrize("variant_nibble", ["8", "9", "a", "b", "A", "B"])
+    def test_accepts_rfc_4122_variant(self, variant_nibble: str) -> None:
+        """Verify validator accepts the RFC 4122/9562 variant nibbles."""
+        uuid_string = f"550e8400-e29b-41d4-{variant_nibble}716-446655440000"
+        assert default_uuid_validator(uuid_string) is True, (
+            f"variant nibble {variant_nibble!r} should be accepted"
+        )
+
+    @pytest.mark.parametrize("variant_nibble", ["0", "7", "c", "f"])
+    def test_rejects_other_variants(self, variant_nibble: str) -> None:
+        """Verify validator rejects NCS, Microsoft, and future variants."""
+        uuid_string = f"550e8400e29b41d4{variant_nibble}716446655440000"
+        assert default_uuid_validator(uuid_string) is False, (
+            f"variant nibble {variant_nibble!r} should be rejected"
+        )
+
+
 class TestDefaultUUIDValidatorCallableInterface:
     """Tests for the validator callable interface."""
 
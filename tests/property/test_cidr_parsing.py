@@ -19,7 +19,8 @@ import pytest
 from hypothesis import given, settings
 from hypothesis import strategies as st
 
-from falcon_correlate import CorrelationIDConfig
+from falcon_correlate import CorrelationIDConfig, CorrelationIDMiddleware
+from falcon_correlate.middleware import _parse_remote_addr
 
 type _IpNetwork = ipaddress.IPv4Network | ipaddress.IPv6Network
 type _IpAddress = ipaddress.IPv4Address | ipaddress.IPv6Address
@@ -70,6 +71,33 @@ def host_bit_violations(draw: st.DrawFn) -> str:
     return f"{host_address}/{prefix}"
 
 
+@st.composite
+def addresses_near_networks(draw: st.DrawFn, networks: list[_IpNetwork]) -> _IpAddress:
+    """Generate addresses that often fall inside or just outside *networks*.
+
+    Parameters
+    ----------
+    draw : st.DrawFn
+        Hypothesis draw callable that samples values from composed
+        strategies.
+    networks : list[_IpNetwork]
+        Trusted networks used to anchor generated addresses.
+
+    Returns
+    -------
+    _IpAddress
+        An arbitrary address, or one offset from a network boundary.
+
+    """
+    if not networks or draw(st.booleans()):
+        return draw(st.ip_addresses())
+    network = draw(st.sampled_from(networks))
+    base = draw(st.sampled_from((network.network_address, network.broadcast_address)))
+    offset = draw(st.integers(min_value=-1, max_value=1))
+    address_type = type(base)
+    return address_type((int(base) + offset) % (1 << base.max_prefixlen))
+
+
 def _first_host_with_bits_set(network: _IpNetwork) -> _IpAddress:
     """Return the first host address inside a network."""
     address_type = type(network.network_address)
@@ -126,3 +154,55 @@ def test_rejects_malformed_cidr_strings(value: str) -> None:
     """Malformed trusted-source strings are rejected."""
     with pytest.raises(ValueError, match="Invalid IP address or CIDR notation"):
         CorrelationIDConfig(trusted_sources=[value])
+
+
+@given(data=st.data(), networks=st.lists(valid_cidr_blocks(), max_size=12))
+@settings(max_examples=100)
+def test_trust_check_matches_network_membership(
+    data: st.DataObject, networks: list[_IpNetwork]
+) -> None:
+    """Trust decisions agree with ``ipaddress`` containment across networks."""
+    middleware = CorrelationIDMiddleware(
+        trusted_sources=[str(network) for network in networks]
+    )
+    address = data.draw(addresses_near_networks(networks))
+    expected = any(address in network for network in networks)
+
+    assert middleware._is_trusted_source(str(address)) is expected, (
+        f"expected {address} trusted={expected} for networks {networks!r}"
+    )
+
+
+def _reference_remote_addr(value: str) -> tuple[int, int] | None:
+    """Parse *value* with ``ipaddress`` as the reference for the fast parser.
+
+    Returns
+    -------
+    tuple[int, int] | None
+        ``(version, integer)`` for a valid address, otherwise ``None``.
+
+    """
+    try:
+        address = ipaddress.ip_address(value)
+    except ValueError:
+        return None
+    return address.version, int(address)
+
+
+@given(
+    value=st.one_of(
+        st.ip_addresses().map(str),
+        st.ip_addresses(v=6).map(lambda address: f"{address}%eth0"),
+        st.text(alphabet="0123456789abcdefABCDEF.:%x ", max_size=45),
+        st.text(max_size=45),
+    )
+)
+@settings(max_examples=200)
+def test_remote_addr_parser_matches_ipaddress(value: str) -> None:
+    """The ``inet_pton`` fast path agrees with ``ipaddress.ip_address``."""
+    # Bypass the LRU cache so every example exercises the parser itself
+    parsed = _parse_remote_addr.__wrapped__(value)
+
+    assert parsed == _reference_remote_addr(value), (
+        f"expected {value!r} to parse like ipaddress.ip_address"
+    )
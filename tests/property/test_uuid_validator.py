@@ -13,6 +13,7 @@ cases are rejected without raising.
 from __future__ import annotations
 
 import re
+import string
 import uuid
 
 from hypothesis import given, settings
@@ -26,6 +27,26 @@ _UUID_PATTERN = re.compile(
     r"[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
 )
 
+# Hex digits plus ASCII and non-ASCII look-alikes that the byte-level scan
+# must reject, including a fullwidth zero that ``str.isdigit`` accepts.
+_NEAR_HEX_ALPHABET = string.hexdigits + "gG-_ x\u00e9\uff10"
+
+
+@st.composite
+def near_hex_uuid_strings(draw: st.DrawFn) -> str:
+    """Generate 32-character strings, optionally in hyphenated layout.
+
+    Returns
+    -------
+    str
+        The value produced for the test scenario.
+
+    """
+    value = draw(st.text(alphabet=_NEAR_HEX_ALPHABET, min_size=32, max_size=32))
+    if draw(st.booleans()):
+        return f"{value[:8]}-{value[8:12]}-{value[12:16]}-{value[16:20]}-{value[20:]}"
+    return value
+
 
 @st.composite
 def valid_uuids(draw: st.DrawFn) -> uuid.UUID:
@@ -100,3 +121,16 @@ def test_rejects_uuid_edge_cases(value: str) -> None:
     assert default_uuid_validator(value) is False, (
         f"expected UUID edge case {value!r} to be rejected"
     )
+
+
+@given(value=near_hex_uuid_strings())
+@settings(max_examples=200)
+def test_byte_scan_matches_reference_for_near_hex_strings(value: str) -> None:
+    """Near-hex strings of UUID length agree with the regex reference check."""
+    expected = (
+        is_valid_uuid_candidate(value) and uuid.UUID(value).variant == uuid.RFC_4122
+    )
+
+    assert default_uuid_validator(value) is expected, (
+        f"expected {value!r} to be {'accepted' if expected else 'rejected'}"
+    )